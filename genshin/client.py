@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import functools
 import json as json_
 import logging
 import os
@@ -29,6 +30,19 @@ __all__ = [
     "ChineseMultiCookieClient",
 ]
 
+try:
+    import orjson
+
+    _json_loads: Callable[[str], Any] = orjson.loads
+except ImportError:
+    _json_loads = json_.loads
+
+
+@functools.lru_cache(maxsize=128)
+def _join_url(base: str, endpoint: Union[str, URL]) -> URL:
+    """Join an endpoint onto a base url, endpoints are reused so the result is cached"""
+    return URL(base).join(URL(endpoint))
+
 
 class GenshinClient:
     """A simple http client for genshin endpoints
@@ -341,7 +355,7 @@ class GenshinClient:
 
         async with self.session.request(method, url, headers=headers, **kwargs) as r:
             r.raise_for_status()
-            data = await r.json()
+            data = await r.json(loads=_json_loads)
 
         if data["retcode"] == 0:
             return data["data"]
@@ -357,7 +371,7 @@ class GenshinClient:
         **kwargs: Any,
     ) -> Any:
         """Request a static json file"""
-        url = URL(self.WEBSTATIC_URL).join(URL(url))
+        url = _join_url(self.WEBSTATIC_URL, url)
 
         data = get_from_static_cache(str(url))
         if data is not None:
@@ -368,7 +382,7 @@ class GenshinClient:
 
         async with self.session.get(url, headers=headers, **kwargs) as r:
             r.raise_for_status()
-            data = await r.json()
+            data = await r.json(loads=_json_loads)
 
         if cache:
             save_to_static_cache(str(url), data)
@@ -399,7 +413,7 @@ class GenshinClient:
         if lang not in LANGS and lang is not None:
             raise ValueError(f"{lang} is not a valid language, must be one of: " + ", ".join(LANGS))
 
-        url = URL(self.TAKUMI_URL).join(URL(endpoint))
+        url = _join_url(self.TAKUMI_URL, endpoint)
 
         headers = {
             "x-rpc-app_version": "1.5.0",
@@ -429,7 +443,7 @@ class GenshinClient:
         User stats related data
         """
         # this is simply just an alias for shorter request endpoints
-        url = URL(self.RECORD_URL).join(URL(endpoint))
+        url = _join_url(self.RECORD_URL, endpoint)
 
         return await self.request_hoyolab(
             url, method=method, cache=cache, cache_check=cache_check, **kwargs
@@ -478,7 +492,7 @@ class GenshinClient:
         if not self.cookies:
             raise RuntimeError("No cookies provided")
 
-        url = URL(self.CALCULATOR_URL).join(URL(endpoint))
+        url = _join_url(self.CALCULATOR_URL, endpoint)
 
         if method == "GET":
             params["lang"] = lang or self.lang
@@ -506,7 +520,7 @@ class GenshinClient:
         if not self.cookies:
             raise RuntimeError("No cookies provided")
 
-        url = URL(self.REWARD_URL).join(URL(endpoint))
+        url = _join_url(self.REWARD_URL, endpoint)
 
         params["lang"] = lang or self.lang
         params["act_id"] = self.ACT_ID
@@ -533,8 +547,7 @@ class GenshinClient:
         if authkey is None:
             raise RuntimeError("No authkey provided")
 
-        base_url = URL(self.GACHA_INFO_URL)
-        url = base_url.join(URL(endpoint))
+        url = _join_url(self.GACHA_INFO_URL, endpoint)
 
         params["authkey_ver"] = 1
         params["authkey"] = unquote(authkey)
@@ -562,8 +575,7 @@ class GenshinClient:
         if authkey is None:
             raise RuntimeError("No authkey provided")
 
-        base_url = URL(self.YSULOG_URL)
-        url = base_url.join(URL(endpoint))
+        url = _join_url(self.YSULOG_URL, endpoint)
 
         params["authkey_ver"] = 1
         params["sign_type"] = 2
@@ -590,7 +602,7 @@ class GenshinClient:
         params = params or {}
 
         base_url = self.STATIC_MAP_URL if static else self.MAP_URL
-        url = URL(base_url).join(URL(endpoint))
+        url = _join_url(base_url, endpoint)
 
         params["map_id"] = map_id
         params["app_sn"] = "ys_obc"
@@ -1504,7 +1516,7 @@ class ChineseClient(GenshinClient):
         if not self.cookies:
             raise RuntimeError("No cookies provided")
 
-        url = URL(self.TAKUMI_URL).join(URL(endpoint))
+        url = _join_url(self.TAKUMI_URL, endpoint)
 
         # all of this repetition is literally just to change these few lines
         headers = {
@@ -1560,7 +1572,7 @@ class ChineseClient(GenshinClient):
         if not self.cookies:
             raise RuntimeError("No cookies provided")
 
-        url = URL(self.REWARD_URL).join(URL(endpoint))
+        url = _join_url(self.REWARD_URL, endpoint)
 
         params.update(await self._complete_uid(uid))
 
@@ -1720,7 +1732,7 @@ class MultiCookieClient(GenshinClient):
         for session in self.sessions.copy():
             async with session.request(method, url, headers=headers, **kwargs) as r:
                 r.raise_for_status()
-                data = await r.json()
+                data = await r.json(loads=_json_loads)
 
             if data["retcode"] == 0:
                 return data["data"]
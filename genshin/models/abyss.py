@@ -46,10 +46,7 @@ class CharacterRanks(GenshinModel):
 
     def as_dict(self, lang: str = "en-us") -> Dict[str, Any]:
         """Helper function which turns fields into properly named ones"""
-        return {
-            self._get_mi18n(field, lang): getattr(self, field.name)
-            for field in self.__fields__.values()
-        }
+        return {label: getattr(self, name) for name, label in self._get_mi18n_labels(lang)}
 
 
 class Battle(GenshinModel):
@@ -20,6 +20,8 @@ __all__ = [
     "Activities",
 ]
 
+_MEDAL_RE = re.compile(r"heraldry_(\w+)\.png")
+
 # ---------------------------------------------------------
 # Hyakunin Ikki:
 
@@ -61,7 +63,7 @@ class HyakuninIkkiChallenge(GenshinModel):
 
     @property
     def medal(self) -> str:
-        match = re.search(r"heraldry_(\w+)\.png", self.medal_icon)
+        match = _MEDAL_RE.search(self.medal_icon)
         return match.group(1) if match else ""
 
 
@@ -240,18 +242,12 @@ class Activities(GenshinModel):
         if not values.get("activities"):
             return values
 
-        slugs = {
-            field.field_info.extra["gslug"]: name
-            for name, field in cls.__fields__.items()
-            if field.field_info.extra.get("gslug")
-        }
-
         for activity in values["activities"]:
             for name, value in activity.items():
                 if "exists_data" not in value:
                     continue
 
-                name = slugs.get(name, name)
+                name = cls._gslugs.get(name, name)
                 values[name] = value if value["exists_data"] else None
 
         return values
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import abc
+import logging
 import re
 import warnings
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Union
 
 from pydantic import BaseModel, Field, root_validator
 from pydantic.fields import ModelField
@@ -19,6 +20,18 @@ __all__ = [
     "PartialCharacter",
 ]
 
+_LOGGER = logging.getLogger(__name__)
+
+_ICON_NAME_RE = re.compile(r"UI_AvatarIcon(?:_Side)?_(.*).png")
+_ICON_BASE = "https://upload-os-bbs.mihoyo.com/game_record/genshin/"
+
+# reverse lookups for character completion, the first character with a given name wins
+_CHARACTERS_BY_ICON: Dict[str, DBChar] = {}
+_CHARACTERS_BY_NAME: Dict[str, DBChar] = {}
+for _char in CHARACTER_NAMES.values():
+    _CHARACTERS_BY_ICON.setdefault(_char.icon_name, _char)
+    _CHARACTERS_BY_NAME.setdefault(_char.name, _char)
+
 
 class GenshinModel(BaseModel, abc.ABC):
     """A genshin model"""
@@ -27,34 +40,61 @@ class GenshinModel(BaseModel, abc.ABC):
     if TYPE_CHECKING:
         _mi18n_urls: ClassVar[Dict[str, str]]
         _mi18n: ClassVar[Dict[str, Dict[str, str]]]
+        _galiases: ClassVar[Tuple[Tuple[str, str], ...]]
+        _timezones: ClassVar[Dict[str, timezone]]
+        _gslugs: ClassVar[Dict[str, str]]
+        _mi18n_labels: ClassVar[Dict[str, Tuple[Tuple[str, str], ...]]]
     else:
         _mi18n_urls = {
             "bbs": "https://webstatic-sea.mihoyo.com/admin/mi18n/bbs_cn/m11241040191111/m11241040191111-{lang}.json",
         }
         _mi18n = {}
+        _galiases = ()
+        _timezones = {}
+        _gslugs = {}
+        _mi18n_labels = {}
 
     def __init__(self, **data: Any) -> None:
         """"""
         # clear the docstring for pdoc
         super().__init__(**data)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # field metadata is static so it's resolved once per class instead of per instance
+        super().__init_subclass__(**kwargs)
+
+        galiases = []
+        cls._timezones = {}
+        cls._gslugs = {}
+        cls._mi18n_labels = {}
+        for name, field in cls.__fields__.items():
+            alias = field.field_info.extra.get("galias")
+            if alias is not None and alias != name:
+                galiases.append((alias, name))
+
+            offset = field.field_info.extra.get("timezone", 0)
+            cls._timezones[name] = timezone(timedelta(hours=offset))
+
+            slug = field.field_info.extra.get("gslug")
+            if slug:
+                cls._gslugs[slug] = name
+
+        cls._galiases = tuple(galiases)
+
     @root_validator(pre=True)
     def __parse_galias(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         """Due to alias being reserved for actual aliases we use a custom alias"""
-        aliases = {}
-        for name, field in cls.__fields__.items():
-            alias = field.field_info.extra.get("galias")
-            if alias is not None:
-                aliases[alias] = name
+        # values is always a fresh dict created by pydantic so it may be renamed in place
+        for alias, name in cls._galiases:
+            if alias in values:
+                values[name] = values.pop(alias)
 
-        return {aliases.get(name, name): value for name, value in values.items()}
+        return values
 
     @root_validator()
     def __parse_timezones(cls, values: Dict[str, Any]) -> Dict[str, Any]:
-        for name, field in cls.__fields__.items():
+        for name, tzinfo in cls._timezones.items():
             if isinstance(values.get(name), datetime) and values[name].tzinfo is None:
-                offset = field.field_info.extra.get("timezone", 0)
-                tzinfo = timezone(timedelta(hours=offset))
                 values[name] = values[name].replace(tzinfo=tzinfo)
 
         return values
@@ -80,6 +120,14 @@ class GenshinModel(BaseModel, abc.ABC):
 
         return super().dict(**kwargs)
 
+    def _copy_and_set_values(
+        self, values: Dict[str, Any], fields_set: Any, *, deep: bool
+    ) -> GenshinModel:
+        # private attributes only cache data derived from fields, which copy(update=...) may change
+        m = super()._copy_and_set_values(values, fields_set, deep=deep)
+        m._init_private_attributes()
+        return m
+
     def _get_mi18n(self, field: ModelField, lang: str) -> str:
         key = field.field_info.extra.get("mi18n")
         if key not in self._mi18n:
@@ -87,8 +135,30 @@ class GenshinModel(BaseModel, abc.ABC):
 
         return self._mi18n[key][lang]
 
+    def _get_mi18n_labels(self, lang: str) -> Tuple[Tuple[str, str], ...]:
+        """Get pairs of field names and their mi18n names
+
+        Only cached once all mi18n has been fetched since it's requested in the background.
+        """
+        if lang in self._mi18n_labels:
+            return self._mi18n_labels[lang]
+
+        labels = tuple(
+            (name, self._get_mi18n(field, lang)) for name, field in self.__fields__.items()
+        )
+        if all(
+            field.field_info.extra.get("mi18n") in self._mi18n
+            for field in self.__fields__.values()
+            if "mi18n" in field.field_info.extra
+        ):
+            self._mi18n_labels[lang] = labels
+
+        return labels
+
     class Config:
         allow_mutation = False
+        # models are immutable so nested instances can be shared instead of copied
+        copy_on_model_validation = "none"
 
 
 class Unique(abc.ABC):
@@ -115,12 +185,11 @@ class CharacterIcon:
                 raise ValueError(f"Invalid character id {icon}")
             self.character_name = char.icon_name
         else:
-            match = re.search(r"UI_AvatarIcon(?:_Side)?_(.*).png", icon)
+            match = _ICON_NAME_RE.search(icon)
             self.character_name = icon if match is None else match.group(1)
 
     def create_icon(self, specifier: str, scale: int = 0) -> str:
-        base = "https://upload-os-bbs.mihoyo.com/game_record/genshin/"
-        return base + f"{specifier}_{self.character_name}{f'@{scale}x' if scale else ''}.png"
+        return _ICON_BASE + f"{specifier}_{self.character_name}{f'@{scale}x' if scale else ''}.png"
 
     @property
     def icon(self) -> str:
@@ -163,20 +232,20 @@ class BaseCharacter(GenshinModel, Unique):
 
         elif icon and "genshin" in icon:
             icon = CharacterIcon(icon)
-            for char in CHARACTER_NAMES.values():
-                if char.icon_name == icon.character_name:
-                    break
+            if icon.character_name in _CHARACTERS_BY_ICON:
+                char = _CHARACTERS_BY_ICON[icon.character_name]
             else:
-                warnings.warn(f"Completing data for an unknown character\n{values!r}")
                 name = icon.character_name
+                warnings.warn(f"Completing data for an unknown character: {name}")
+                _LOGGER.debug("Unknown character data: %r", values)
                 char = DBChar(0, name, name, "Anemo", 5)
 
         elif name:
-            for char in CHARACTER_NAMES.values():
-                if char.name == name:
-                    break
+            if name in _CHARACTERS_BY_NAME:
+                char = _CHARACTERS_BY_NAME[name]
             else:
-                warnings.warn(f"Completing data for a partial character\n{values!r}")
+                warnings.warn(f"Completing data for a partial character: {name}")
+                _LOGGER.debug("Partial character data: %r", values)
                 partial = True
                 char = DBChar(0, name, name, "Anemo", 5)
 
@@ -25,6 +25,7 @@ __all__ = [
     "CALCULATOR_ELEMENTS",
     "CALCULATOR_WEAPON_TYPES",
     "CALCULATOR_ARTIFACTS",
+    "TalentType",
     "CalculatorCharacter",
     "CalculatorWeapon",
     "CalculatorArtifact",
@@ -61,6 +62,16 @@ CALCULATOR_ARTIFACTS: Dict[int, str] = {
     5: "Circlet of Logos",
 }
 
+TalentType = Literal["attack", "skill", "burst", "passive", "dash"]
+
+# talent types of active talents by their order in the group id
+_TALENT_TYPES: Dict[int, TalentType] = {
+    1: "attack",
+    2: "skill",
+    3: "dash",
+    9: "burst",
+}
+
 
 class CalculatorCharacter(BaseCharacter):
     """A character meant to be used with calculators"""
@@ -132,7 +143,7 @@ class CalculatorTalent(GenshinModel, Unique):
     max_level: int
 
     @property
-    def type(self) -> Literal["attack", "skill", "burst", "passive", "dash"]:
+    def type(self) -> TalentType:
         """The type of the talent, parsed from the group id"""
         # It's Possible to parse this from the id too but group id feels more reliable
 
@@ -142,14 +153,8 @@ class CalculatorTalent(GenshinModel, Unique):
 
         if identifier == 2:
             return "passive"
-        elif order == 1:
-            return "attack"
-        elif order == 2:
-            return "skill"
-        elif order == 9:
-            return "burst"
-        elif order == 3:
-            return "dash"
+        elif order in _TALENT_TYPES:
+            return _TALENT_TYPES[order]
         else:
             raise ValueError(f"Cannot parse type for talent {self.group_id!r} (group {group})")
 
@@ -1,8 +1,8 @@
 import re
 from enum import IntEnum
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, validator
 
 from .base import GenshinModel
 
@@ -15,6 +15,14 @@ __all__ = [
     "SearchUser",
 ]
 
+_TAG_RE = re.compile(r"<.+?>")
+
+_RECORD_SETTING_NAMES = {
+    1: "Battle Chronicle",
+    2: "Character Details",
+    3: "Real-Time Notes",
+}
+
 
 class GenshinAccount(GenshinModel):
     """A genshin account"""
@@ -42,11 +50,7 @@ class RecordCardSetting(GenshinModel):
 
     @property
     def name(self) -> str:
-        return {
-            1: "Battle Chronicle",
-            2: "Character Details",
-            3: "Real-Time Notes",
-        }.get(self.id, "")
+        return _RECORD_SETTING_NAMES.get(self.id, "")
 
 
 class RecordCard(GenshinAccount):
@@ -62,17 +66,26 @@ class RecordCard(GenshinAccount):
     has_uid: bool = Field(galias="has_role")
     public: bool = Field(galias="is_public")
 
+    # data values parsed on first access, numeric values are ints
+    _values: Optional[List[Any]] = PrivateAttr(None)
+
+    def _get_values(self) -> List[Any]:
+        if self._values is None:
+            self._values = [int(d.value) if d.value.isdigit() else d.value for d in self.data]
+
+        return self._values
+
     @property
     def days_active(self) -> int:
-        return int(self.data[0].value)
+        return int(self._get_values()[0])
 
     @property
     def characters(self) -> int:
-        return int(self.data[1].value)
+        return int(self._get_values()[1])
 
     @property
     def achievements(self) -> int:
-        return int(self.data[2].value)
+        return int(self._get_values()[2])
 
     @property
     def spiral_abyss(self) -> str:
@@ -85,7 +98,7 @@ class RecordCard(GenshinAccount):
 
     def as_dict(self) -> Dict[str, Any]:
         """Helper function which turns fields into properly named ones"""
-        return {d.name: (int(d.value) if d.value.isdigit() else d.value) for d in self.data}
+        return {d.name: value for d, value in zip(self.data, self._get_values())}
 
 
 class Gender(IntEnum):
@@ -107,4 +120,4 @@ class SearchUser(GenshinModel):
 
     @validator("nickname")
     def __remove_tag(cls, v: str) -> str:
-        return re.sub(r"<.+?>", "", v)
+        return _TAG_RE.sub("", v)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, validator
 
 from .abyss import SpiralAbyssPair
 from .activities import Activities
@@ -21,6 +21,8 @@ __all__ = [
     "FullUserStats",
 ]
 
+_DIGIT_RE = re.compile(r"\d")
+
 # flake8: noqa: E222
 class Stats(GenshinModel):
     """Overall user stats"""
@@ -45,10 +47,7 @@ class Stats(GenshinModel):
 
     def as_dict(self, lang: str = "en-us") -> Dict[str, Any]:
         """Helper function which turns fields into properly named ones"""
-        return {
-            self._get_mi18n(field, lang): getattr(self, field.name)
-            for field in self.__fields__.values()
-        }
+        return {label: getattr(self, name) for name, label in self._get_mi18n_labels(lang)}
 
 
 class Offering(GenshinModel):
@@ -81,10 +80,16 @@ class TeapotRealm(GenshinModel):
     name: str
     icon: str
 
+    # parsed from the icon on first access
+    _id: Optional[int] = PrivateAttr(None)
+
     @property
     def id(self) -> int:
-        match = re.search(r"\d", self.icon)
-        return int(match.group()) if match else 0
+        if self._id is None:
+            match = _DIGIT_RE.search(self.icon)
+            self._id = int(match.group()) if match else 0
+
+        return self._id
 
 
 class Teapot(GenshinModel):
@@ -113,7 +118,9 @@ class PartialUserStats(GenshinModel):
             return None
         if isinstance(v, dict):
             return v
-        return {**v[0], "realms": v}
+        teapot = v[0].copy()
+        teapot["realms"] = v
+        return teapot
 
 
 class UserStats(PartialUserStats):
@@ -1,6 +1,6 @@
 import re
 from datetime import datetime
-from typing import Any, List, Literal, Optional
+from typing import Any, List, Literal, Optional, Union
 
 from pydantic import Field, validator
 
@@ -20,6 +20,28 @@ BannerType = Literal[100, 200, 301, 302, 400]
 
 BANNER_TYPES: List[BannerType] = [100, 200, 301, 302, 400]
 
+_TAG_RE = re.compile(r"<.*?>")
+
+_BANNER_TYPE_NAMES = {
+    100: "Novice Wishes",
+    200: "Permanent Wish",
+    301: "Character Event Wish",
+    302: "Weapon Event Wish",
+    400: "Character Event Wish",
+}
+
+_ELEMENTS = {
+    "风": "Anemo",
+    "火": "Pyro",
+    "水": "Hydro",
+    "雷": "Electro",
+    "冰": "Cryo",
+    "岩": "Geo",
+    "草": "Dendro",
+    "": "",
+}
+_ELEMENT_NAMES = frozenset(_ELEMENTS.values())
+
 
 class Wish(GenshinModel, Unique):
     """A wish made on any banner"""
@@ -61,16 +83,8 @@ class BannerDetailsUpItem(GenshinModel):
 
     @validator("element", pre=True)
     def __parse_element(cls, v: str) -> str:
-        return {
-            "风": "Anemo",
-            "火": "Pyro",
-            "水": "Hydro",
-            "雷": "Electro",
-            "冰": "Cryo",
-            "岩": "Geo",
-            "草": "Dendro",
-            "": "",
-        }[v]
+        # already parsed when validating a dict of this model
+        return v if v in _ELEMENT_NAMES else _ELEMENTS[v]
 
 
 class BannerDetails(GenshinModel):
@@ -113,23 +127,19 @@ class BannerDetails(GenshinModel):
         "r3_guarantee_prob",
         pre=True,
     )
-    def __parse_percentage(cls, v: str) -> Optional[float]:
+    def __parse_percentage(cls, v: Union[str, float, None]) -> Optional[float]:
+        if not isinstance(v, str):
+            return v
+
         return None if v == "0%" else float(v[:-1].replace(",", "."))
 
     @property
     def name(self) -> str:
-        return re.sub(r"<.*?>", "", self.title).strip()
+        return _TAG_RE.sub("", self.title).strip()
 
     @property
     def banner_type_name(self) -> str:
-        banners = {
-            100: "Novice Wishes",
-            200: "Permanent Wish",
-            301: "Character Event Wish",
-            302: "Weapon Event Wish",
-            400: "Character Event Wish",
-        }
-        return banners[self.banner_type]
+        return _BANNER_TYPE_NAMES[self.banner_type]
 
     @property
     def items(self) -> List[BannerDetailItem]:
@@ -17,6 +17,16 @@ __all__ = [
     "is_chinese",
 ]
 
+_UID_SERVERS = {
+    "1": "cn_gf01",
+    "2": "cn_gf01",
+    "5": "cn_qd01",
+    "6": "os_usa",
+    "7": "os_euro",
+    "8": "os_asia",
+    "9": "os_cht",
+}
+
 
 def generate_dynamic_secret(salt: str) -> str:
     """Creates a new overseas dynamic secret
@@ -58,15 +68,7 @@ def recognize_server(uid: int) -> str:
 
     :param uid: A genshin uid
     """
-    server = {
-        "1": "cn_gf01",
-        "2": "cn_gf01",
-        "5": "cn_qd01",
-        "6": "os_usa",
-        "7": "os_euro",
-        "8": "os_asia",
-        "9": "os_cht",
-    }.get(str(uid)[0])
+    server = _UID_SERVERS.get(str(uid)[0])
 
     if server:
         return server
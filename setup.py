@@ -14,11 +14,12 @@ setup(
     },
     packages=find_packages(exclude=["tests"]),
     python_requires=">=3.8",
-    install_requires=["aiohttp", "pydantic", "yarl", "typing-extensions"],
+    install_requires=["aiohttp", "pydantic>=1.9.2,<2", "yarl", "typing-extensions"],
     extras_require={
-        "all": ["cachetools", "browser-cookie3", "typer"],
+        "all": ["cachetools", "browser-cookie3", "typer", "orjson"],
         "cookies": ["browser-cookie3"],
         "cache": ["cachetools"],
+        "speedups": ["orjson"],
         "cli": ["typer", "browser-cookie3"],
         "test": ["pytest", "pytest-asyncio", "cachetools"],
         "doc": ["mkdocs-material", "pdoc"],
@@ -1,4 +1,7 @@
 from genshin.models.base import BaseCharacter, CharacterIcon
+from genshin.models.hoyolab import GenshinAccount, RecordCard, RecordCardData
+from genshin.models.stats import TeapotRealm
+from genshin.models.wish import BannerDetails
 
 
 def test_character_icon():
@@ -24,3 +27,96 @@ def test_base_character():
     base = "https://upload-os-bbs.mihoyo.com/game_record/genshin/"
     char = BaseCharacter(icon=base + "character_icon/UI_AvatarIcon_Kazuha.png")
     assert char.name == "Kaedehara Kazuha"
+
+    icon = base + "character_icon/UI_AvatarIcon_Kazuha.png"
+    char = BaseCharacter(icon=base + "character_icon/UI_AvatarIcon_Side_Kazuha.png")
+    assert char.icon == icon
+    assert char.side_icon == base + "character_side_icon/UI_AvatarIcon_Side_Kazuha.png"
+
+    char = BaseCharacter(icon=icon + "?x=1")
+    assert char.icon == icon
+
+    # reading derived icons must not leak into serialization
+    before = char.json()
+    assert char.image and char.side_icon
+    assert char.json() == before
+
+
+def test_galias():
+    account = GenshinAccount(
+        game_uid=710785423, level=60, nickname="a", region="os_euro", region_name="Europe"
+    )
+    assert account.uid == 710785423
+    assert account.server == "os_euro"
+
+    card = RecordCard(
+        game_role_id=710785423,
+        level=60,
+        nickname="a",
+        region="os_euro",
+        region_name="Europe",
+        data=[
+            {"name": "Days Active", "value": "420"},
+            {"name": "Characters", "value": "37"},
+            {"name": "Achievements", "value": "512"},
+            {"name": "Spiral Abyss", "value": "12-3"},
+        ],
+        data_switches=[],
+        background_image="",
+        has_role=True,
+        is_public=True,
+    )
+    assert card.uid == 710785423
+    assert card.days_active == 420
+    assert card.spiral_abyss == "12-3"
+    assert card.as_dict() == {
+        "Days Active": 420,
+        "Characters": 37,
+        "Achievements": 512,
+        "Spiral Abyss": "12-3",
+    }
+
+    constructed = RecordCard.construct(data=card.data)
+    assert constructed.days_active == 420
+
+    data = [*card.data[:1], RecordCardData(name="Characters", value="38"), *card.data[2:]]
+    updated = card.copy(update={"data": data})
+    assert updated.characters == 38
+    assert updated.as_dict()["Characters"] == 38
+
+
+def test_banner_details_roundtrip():
+    item = dict(item_name="Xiao", item_type="Character", item_attr="风", item_img="")
+    details = BannerDetails(
+        banner_id="abc",
+        gacha_type=301,
+        title="<b>Invitation to Mundane Life</b>",
+        content="",
+        date_range="",
+        r5_up_prob="50%",
+        r4_up_prob="0%",
+        r5_prob="0,6%",
+        r4_prob="5.1%",
+        r3_prob="94.3%",
+        r5_baodi_prob="1.6%",
+        r4_baodi_prob="13%",
+        r3_baodi_prob="0%",
+        r5_up_items=[item],
+        r4_up_items=None,
+        r5_prob_list=[],
+        r4_prob_list=[],
+        r3_prob_list=[],
+    )
+    assert details.r5_prob == 0.6
+    assert details.r4_up_prob is None
+    assert details.r5_up_items[0].element == "Anemo"
+
+    assert BannerDetails.parse_obj(details.dict()) == details
+
+
+def test_teapot_realm_copy():
+    realm = TeapotRealm(name="Emerald Peak", icon="https://example.com/realm_3.png")
+    assert realm.id == 3
+
+    updated = realm.copy(update={"icon": "https://example.com/realm_4.png"})
+    assert updated.id == 4